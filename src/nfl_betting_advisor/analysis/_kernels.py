@@ -0,0 +1,28 @@
+"""Optional Numba-compiled kernels for hot advisor math."""
+from __future__ import annotations
+
+try:  # pragma: no cover - optional dependency handling
+    from numba import njit  # type: ignore
+except Exception:  # pragma: no cover
+    njit = None  # type: ignore
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def combine_signals(signals, weights):  # pragma: no cover - compiled path
+        # Fused dot-product-and-mean over an (n, 4) signal matrix; cache=True
+        # persists the compiled artifact across process launches
+        total = 0.0
+        for i in range(signals.shape[0]):
+            total += (
+                signals[i, 0] * weights[0]
+                + signals[i, 1] * weights[1]
+                + signals[i, 2] * weights[2]
+                + signals[i, 3] * weights[3]
+            )
+        return total / signals.shape[0]
+
+else:
+    # Signals callers to fall back to the pure-Python reference path
+    combine_signals = None
@@ -2,21 +2,77 @@
 from __future__ import annotations
 
 import logging
+import re
+from bisect import bisect_left
 from dataclasses import dataclass, field
+from functools import lru_cache
 from statistics import mean
-from typing import Dict, List, Optional
+from typing import ClassVar, Dict, List, Optional, Tuple
 
-from ..models import BetLeg, EvaluationResult, Parlay
+from ..models import BetLeg, EvaluationResult, LegBreakdown, Parlay
 from ..utils import expected_value
+from ._kernels import combine_signals as _jit_combine_signals
+
+try:  # pragma: no cover - optional dependency handling
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
 
 LOGGER = logging.getLogger(__name__)
 
+# Below this leg count the NumPy array setup costs more than it saves
+_VECTORIZE_MIN_LEGS = 4
+
+# Single compiled scan replacing five per-note substring tests; IGNORECASE
+# also avoids allocating a lowered copy of each note
+_SIGNAL_RE = re.compile(
+    r"(?P<injury>injury multiplier|missing)"
+    r"|(?P<history>historical)"
+    r"|(?P<market>line movement|best price)",
+    re.IGNORECASE,
+)
+_SIGNAL_WEIGHTS = {"injury": 0.1, "history": 0.1, "market": 0.05}
+
+# Sorted score thresholds and the verdict band above each one
+_VERDICT_THRESHOLDS = (-0.1, 0.05, 0.15)
+_VERDICT_LABELS = ("High Risk", "Neutral", "Moderate Value", "Strong Value")
+
+
+def _classify_verdict(overall_score: float, expected_val: Optional[float]) -> str:
+    # Table-driven replacement for the old if/elif chain; bisect_left keeps
+    # ties at the upper thresholds in the lower band (the old comparisons
+    # were strict), and the explicit bump preserves score == -0.1 -> Neutral
+    index = bisect_left(_VERDICT_THRESHOLDS, overall_score)
+    if index == 0 and overall_score >= _VERDICT_THRESHOLDS[0]:
+        index = 1
+    verdict = _VERDICT_LABELS[index]
+    # Strong Value additionally requires a positive expected value
+    if verdict == "Strong Value" and not (expected_val or 0) > 0:
+        verdict = "Moderate Value"
+    return verdict
+
+
+@lru_cache(maxsize=4096)
+def _score_signals(
+    implied_prob: float, adjusted: float, notes: Tuple[str, ...]
+) -> Tuple[float, float, float, float]:
+    # Memoized on the immutable leg signature so repeated evaluations of the
+    # same leg (hybrid mode, re-runs within a session) skip the note scan
+    ev_contribution = (adjusted - implied_prob) / implied_prob if implied_prob else 0
+    signals = {"injury": 0.0, "history": 0.0, "market": 0.0}
+    # One regex pass per note; dedupe groups so a note still counts each
+    # signal category at most once, matching the old substring tests
+    for note in notes:
+        for group in {match.lastgroup for match in _SIGNAL_RE.finditer(note)}:
+            signals[group] += _SIGNAL_WEIGHTS[group]
+    return ev_contribution, signals["injury"], signals["history"], signals["market"]
+
 
 @dataclass
 class AnalysisContext:
     """Holds the raw signals and data used for AI analysis."""
     parlay: Parlay
-    leg_scores: Dict[str, Dict[str, float]]
+    leg_scores: Dict[str, LegBreakdown]
     overall_score: float
     expected_value: Optional[float]
     combined_probability: Optional[float]
@@ -27,112 +83,95 @@ class AnalysisContext:
 class HeuristicAIAdvisor:
     """A lightweight rules-based advisor that simulates AI judgement."""
 
-    def __init__(self) -> None:
-        # Defines weighting for each signal contributing to the final value score
-        self.weights = {
-            "ev_weight": 0.5,
-            "injury_weight": 0.2,
-            "history_weight": 0.15,
-            "market_weight": 0.15,
-        }
+    # Constant signal weights in (ev, injury, history, market) order, held
+    # at class level so construction allocates nothing per instance
+    _weights_vec: ClassVar[Tuple[float, float, float, float]] = (0.5, 0.2, 0.15, 0.15)
 
-    def _score_leg(self, leg: BetLeg) -> Dict[str, float]:
+    # Named view of the same constants, kept for external consumers
+    weights: ClassVar[Dict[str, float]] = {
+        "ev_weight": _weights_vec[0],
+        "injury_weight": _weights_vec[1],
+        "history_weight": _weights_vec[2],
+        "market_weight": _weights_vec[3],
+    }
+
+    def _score_leg(self, leg: BetLeg) -> LegBreakdown:
         # Derives implied, baseline, and adjusted probabilities for this leg
         implied_prob = leg.implied_probability()
         baseline = leg.baseline_probability or implied_prob
         adjusted = leg.adjusted_probability or baseline
-        # Calculates how much the adjustment changes the value of the leg
-        ev_contribution = (adjusted - implied_prob) / implied_prob if implied_prob else 0
-        injury_signal = 0.0
-        history_signal = 0.0
-        market_signal = 0.0
-        # Parses notes to gather qualitative signals for each leg
-        for note in leg.notes:
-            lowered = note.lower()
-            if "injury multiplier" in lowered or "missing" in lowered:
-                injury_signal += 0.1
-            if "historical" in lowered:
-                history_signal += 0.1
-            if "line movement" in lowered or "best price" in lowered:
-                market_signal += 0.05
-        return {
-            "ev": ev_contribution,
-            "injury": injury_signal,
-            "history": history_signal,
-            "market": market_signal,
-            "implied_prob": implied_prob,
-            "adjusted_prob": adjusted,
-        }
+        # Delegates the pure math and note-scan to the memoized helper
+        ev_contribution, injury_signal, history_signal, market_signal = _score_signals(
+            implied_prob, adjusted, tuple(leg.notes)
+        )
+        # Slotted record instead of a per-leg dict: fixed fields, no hash
+        # lookups for consumers, and a smaller footprint per breakdown
+        return LegBreakdown(
+            ev=ev_contribution,
+            injury=injury_signal,
+            history=history_signal,
+            market=market_signal,
+            implied_prob=implied_prob,
+            adjusted_prob=adjusted,
+        )
 
-    def evaluate(self, parlay: Parlay) -> EvaluationResult:
-        # Collects per-leg scoring context and calculates parlay-wide stats
-        leg_scores: Dict[str, Dict[str, float]] = {}
-        combined_probability = parlay.combined_probability()
-        combined_decimal_odds = parlay.combined_decimal_odds()
-        expected_val = (
-            expected_value(combined_probability, combined_decimal_odds, parlay.stake)
-            if combined_probability is not None
-            else None
+    def _combine_signals(self, signal_rows: List[Tuple[float, float, float, float]]) -> float:
+        # Reduces per-leg signal rows to the mean weighted value score,
+        # vectorizing with NumPy when the parlay is large enough to pay off
+        if not signal_rows:
+            return 0
+        if np is not None and len(signal_rows) >= _VECTORIZE_MIN_LEGS:
+            signals = np.asarray(signal_rows)
+            weights = np.asarray(self._weights_vec)
+            if _jit_combine_signals is not None:
+                # Numba path: fused dot-product-and-mean compiled to machine code
+                return float(_jit_combine_signals(signals, weights))
+            return float((signals @ weights).mean())
+        w_ev, w_injury, w_history, w_market = self._weights_vec
+        return mean(
+            ev * w_ev + injury * w_injury + history * w_history + market * w_market
+            for ev, injury, history, market in signal_rows
         )
-        value_scores: List[float] = []
-        rationale: List[str] = []
-        # Scores each leg and builds the narrative rationale
-        for leg in parlay.legs:
-            scores = self._score_leg(leg)
-            leg_scores[leg.leg_id] = scores
-            value_score = (
-                scores["ev"] * self.weights["ev_weight"]
-                + scores["injury"] * self.weights["injury_weight"]
-                + scores["history"] * self.weights["history_weight"]
-                + scores["market"] * self.weights["market_weight"]
-            )
-            value_scores.append(value_score)
-            rationale.append(
-                f"Leg {leg.leg_id} {leg.description}: adjusted probability {scores['adjusted_prob']:.2%}"
-            )
-            if leg.notes:
-                rationale.extend(f"  - {note}" for note in leg.notes)
 
-        overall_score = mean(value_scores) if value_scores else 0
-        if expected_val is not None:
-            rationale.append(f"Combined expected value: ${expected_val:.2f}")
-        if combined_probability is not None:
-            rationale.append(f"Parlay hit probability: {combined_probability:.2%}")
-
-        # Converts the aggregated score into a human-readable verdict
-        if overall_score > 0.15 and (expected_val or 0) > 0:
-            verdict = "Strong Value"
-        elif overall_score > 0.05:
-            verdict = "Moderate Value"
-        elif overall_score < -0.1:
-            verdict = "High Risk"
-        else:
-            verdict = "Neutral"
+    def evaluate(self, parlay: Parlay) -> EvaluationResult:
+        # Runs the shared analysis once and wraps it for callers
+        context = self.get_analysis_context(parlay)
+        return self.result_from_context(context)
+
+    def evaluate_batch(self, parlays: List[Parlay]) -> List[EvaluationResult]:
+        """Evaluate several parlays in one call, e.g. for backtest sweeps."""
+        return [self.evaluate(parlay) for parlay in parlays]
+
+    def result_from_context(self, context: AnalysisContext) -> EvaluationResult:
+        """Converts an already-computed AnalysisContext into an EvaluationResult."""
+        # Appends the parlay-wide summary lines to the rationale for display
+        rationale = list(context.rationale)
+        if context.expected_value is not None:
+            rationale.append(f"Combined expected value: ${context.expected_value:.2f}")
+        if context.combined_probability is not None:
+            rationale.append(f"Parlay hit probability: {context.combined_probability:.2%}")
 
         LOGGER.debug(
             "Parlay evaluation -> score: %.3f, verdict: %s, expected value: %s",
-            overall_score,
-            verdict,
-            expected_val,
+            context.overall_score,
+            context.verdict,
+            context.expected_value,
         )
 
         return EvaluationResult(
-            overall_value_score=overall_score,
-            verdict=verdict,
-            expected_value=expected_val,
-            combined_probability=combined_probability,
+            overall_value_score=context.overall_score,
+            verdict=context.verdict,
+            expected_value=context.expected_value,
+            combined_probability=context.combined_probability,
             rationale=rationale,
-            leg_breakdown=leg_scores,
+            leg_breakdown=context.leg_scores,
         )
 
     def get_analysis_context(self, parlay: Parlay) -> AnalysisContext:
         """Returns the raw analysis data without wrapping it in an EvaluationResult."""
-        # This reuses the logic from evaluate but returns the intermediate state
-        # Ideally, evaluate() should call this, but for minimal refactoring risk,
-        # we will duplicate the orchestration logic slightly or have evaluate call this.
-        # Let's have evaluate call this to ensure consistency.
-        
-        leg_scores: Dict[str, Dict[str, float]] = {}
+        # Single home for the per-leg scoring and verdict orchestration;
+        # evaluate() maps the result onto an EvaluationResult.
+        leg_scores: Dict[str, LegBreakdown] = {}
         combined_probability = parlay.combined_probability()
         combined_decimal_odds = parlay.combined_decimal_odds()
         expected_val = (
@@ -140,36 +179,22 @@ class HeuristicAIAdvisor:
             if combined_probability is not None
             else None
         )
-        value_scores: List[float] = []
         rationale: List[str] = []
-        
+        signal_rows: List[Tuple[float, float, float, float]] = []
+
         for leg in parlay.legs:
             scores = self._score_leg(leg)
             leg_scores[leg.leg_id] = scores
-            value_score = (
-                scores["ev"] * self.weights["ev_weight"]
-                + scores["injury"] * self.weights["injury_weight"]
-                + scores["history"] * self.weights["history_weight"]
-                + scores["market"] * self.weights["market_weight"]
-            )
-            value_scores.append(value_score)
+            signal_rows.append((scores.ev, scores.injury, scores.history, scores.market))
             rationale.append(
-                f"Leg {leg.leg_id} {leg.description}: adjusted probability {scores['adjusted_prob']:.2%}"
+                f"Leg {leg.leg_id} {leg.description}: adjusted probability {scores.adjusted_prob:.2%}"
             )
             if leg.notes:
                 rationale.extend(f"  - {note}" for note in leg.notes)
 
-        overall_score = mean(value_scores) if value_scores else 0
-        
-        if overall_score > 0.15 and (expected_val or 0) > 0:
-            verdict = "Strong Value"
-        elif overall_score > 0.05:
-            verdict = "Moderate Value"
-        elif overall_score < -0.1:
-            verdict = "High Risk"
-        else:
-            verdict = "Neutral"
-            
+        overall_score = self._combine_signals(signal_rows)
+        verdict = _classify_verdict(overall_score, expected_val)
+
         return AnalysisContext(
             parlay=parlay,
             leg_scores=leg_scores,
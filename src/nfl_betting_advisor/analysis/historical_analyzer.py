@@ -15,20 +15,26 @@ class HistoricalAnalyzer:
     def __init__(self, head_to_head_record: Dict[str, int]):
         # Stores the win-loss record between two teams for quick lookups
         self.head_to_head_record = head_to_head_record
+        # Precomputes the sample size and per-team win rates once so each
+        # adjust_leg call is an O(1) lookup instead of a dict summation
+        self._total_games = sum(head_to_head_record.values())
+        if self._total_games > 0:
+            self._win_rates = {
+                team: wins / self._total_games for team, wins in head_to_head_record.items()
+            }
+        else:
+            self._win_rates = {}
 
     def adjust_leg(self, leg: BetLeg, target_team: Optional[str] = None) -> Optional[float]:
         # Skips adjustments when no baseline probability is set
         if leg.baseline_probability is None:
             return None
-        # Exits early when no target team or record is available
-        if not target_team or target_team not in self.head_to_head_record:
+        # Exits early when no target team, record, or sample is available
+        win_rate = self._win_rates.get(target_team) if target_team else None
+        if win_rate is None:
             return None
-        # Totals the historical sample size to guard against division by zero
-        total_games = sum(self.head_to_head_record.values())
-        if total_games == 0:
-            return None
-        team_wins = self.head_to_head_record.get(target_team, 0)
-        win_rate = team_wins / total_games
+        total_games = self._total_games
+        team_wins = self.head_to_head_record[target_team]
         baseline = 0.5
         # Calculates a modest multiplier favoring teams with recent dominance
         adjustment = (win_rate - baseline) * 0.3
@@ -2,14 +2,27 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
+from itertools import chain
 from typing import Dict, List, Optional
 
 from ..models import BetLeg
 
 LOGGER = logging.getLogger(__name__)
 
-KEY_DEFENSIVE_POSITIONS = {"CB", "DB", "FS", "SS", "S", "LB", "DE", "DT", "EDGE"}
-OFFENSIVE_SKILL_POSITIONS = {"QB", "RB", "WR", "TE"}
+KEY_DEFENSIVE_POSITIONS = frozenset({"CB", "DB", "FS", "SS", "S", "LB", "DE", "DT", "EDGE"})
+OFFENSIVE_SKILL_POSITIONS = frozenset({"QB", "RB", "WR", "TE"})
+
+
+@dataclass
+class _InjurySignal:
+    """A pre-digested injury entry with position flags stamped at index time."""
+
+    name: str
+    position: str
+    team: str
+    is_key_defender: bool
+    is_offensive_star: bool
 
 
 class InjuryAdjuster:
@@ -18,17 +31,41 @@ class InjuryAdjuster:
     def __init__(self, injuries: List[Dict]):
         # Caches the raw injury feed for later filtering
         self.injuries = injuries
+        # Indexes actionable (Out/Doubtful) injuries by team once so each
+        # leg only scans the handful of entries for the relevant team; the
+        # position-set membership tests are stamped as booleans here so the
+        # hot loop reads flags instead of probing the raw dicts
+        self._by_team: Dict[str, List[_InjurySignal]] = {}
+        for injury in injuries:
+            if injury.get("Status") in {"Out", "Doubtful"}:
+                position = injury.get("Position", "")
+                self._by_team.setdefault(injury.get("Team"), []).append(
+                    _InjurySignal(
+                        name=injury.get("Name", ""),
+                        position=position,
+                        team=injury.get("Team", ""),
+                        is_key_defender=position in KEY_DEFENSIVE_POSITIONS,
+                        is_offensive_star=position in OFFENSIVE_SKILL_POSITIONS,
+                    )
+                )
 
-    def _is_key_defender(self, injury: Dict) -> bool:
-        # Identifies defensive players whose absence boosts offensive bets
-        return injury.get("Position") in KEY_DEFENSIVE_POSITIONS
+    def adjust_leg(self, leg: BetLeg, opponent_team: Optional[str] = None) -> Optional[float]:
+        """Return the adjusted probability for a single bet leg."""
+        return self.adjust_legs([leg], opponent_team=opponent_team)[0]
 
-    def _is_offensive_star(self, injury: Dict) -> bool:
-        # Flags offensive skill players whose injuries hurt their own team's props
-        return injury.get("Position") in OFFENSIVE_SKILL_POSITIONS
+    def adjust_legs(
+        self, legs: List[BetLeg], opponent_team: Optional[str] = None
+    ) -> List[Optional[float]]:
+        """Return adjusted probabilities for legs sharing one opponent team."""
+        # Resolves the candidate injury list once for the whole batch so
+        # per-leg work skips the team lookup entirely
+        if opponent_team:
+            candidates = self._by_team.get(opponent_team, ())
+        else:
+            candidates = tuple(chain.from_iterable(self._by_team.values()))
+        return [self._adjust_with_candidates(leg, candidates) for leg in legs]
 
-    def adjust_leg(self, leg: BetLeg, opponent_team: Optional[str] = None) -> Optional[float]:
-        """Return the adjustment multiplier for a bet leg."""
+    def _adjust_with_candidates(self, leg: BetLeg, candidates) -> Optional[float]:
         # Skips legs without a baseline probability to avoid compounding None
         if leg.baseline_probability is None:
             LOGGER.debug("Skipping injury adjustment for leg %s: no baseline probability", leg.leg_id)
@@ -36,22 +73,18 @@ class InjuryAdjuster:
 
         multiplier = 1.0
         adjustments: List[str] = []
-        # Scans each injury entry and accumulates multipliers as signals
-        for injury in self.injuries:
-            team = injury.get("Team")
-            if opponent_team and team != opponent_team:
-                continue
-            if injury.get("Status") in {"Out", "Doubtful"}:
-                if self._is_key_defender(injury) and leg.player and leg.player.team != team:
-                    multiplier += 0.05
-                    adjustments.append(
-                        f"Opponent missing key defender {injury.get('Name')} ({injury.get('Position')})"
-                    )
-                elif self._is_offensive_star(injury) and leg.player and leg.player.team == team:
-                    multiplier -= 0.05
-                    adjustments.append(
-                        f"{leg.player.name}'s teammate {injury.get('Name')} ({injury.get('Position')}) is out"
-                    )
+        # Accumulates multipliers from the actionable injuries as signals
+        for injury in candidates:
+            if injury.is_key_defender and leg.player and leg.player.team != injury.team:
+                multiplier += 0.05
+                adjustments.append(
+                    f"Opponent missing key defender {injury.name} ({injury.position})"
+                )
+            elif injury.is_offensive_star and leg.player and leg.player.team == injury.team:
+                multiplier -= 0.05
+                adjustments.append(
+                    f"{leg.player.name}'s teammate {injury.name} ({injury.position}) is out"
+                )
         multiplier = max(0.05, multiplier)
         if abs(multiplier - 1.0) > 1e-6:
             # Stores the adjustment notes for downstream rationale reporting
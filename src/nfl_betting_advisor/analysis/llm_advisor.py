@@ -1,87 +1,131 @@
 """LLM-based advisor using Google Gemini."""
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
-from typing import Optional
-
-import google.generativeai as genai
-from dotenv import load_dotenv
+from collections import OrderedDict
+from typing import Dict, Optional
 
 from ..models import EvaluationResult
 from .ai_advisor import AnalysisContext, HeuristicAIAdvisor
 
 LOGGER = logging.getLogger(__name__)
 
+# One-shot guard and shared model cache so repeated advisor construction
+# (backtests, sweeps) neither re-reads .env nor rebuilds the Gemini client
+_ENV_LOADED = False
+_MODEL_CACHE: Dict[tuple, object] = {}
+
+# Static prompt sections hoisted to module scope so they are built once
+_PROMPT_HEADER = """\
+You are an expert NFL betting advisor. Your goal is to explain the value of a parlay bet based on PRE-CALCULATED mathematical data.
+DO NOT recalculate probabilities. Trust the provided numbers."""
+
+_PROMPT_TASK = """
+TASK:
+Write a concise, professional analysis of this parlay.
+1. Start with a clear "Recommendation" (e.g., "This is a strong play because...", "Proceed with caution due to...").
+2. Analyze the key legs. Explain WHY the model adjusted the probability (refer to the signals like injuries or history).
+3. Mention the Expected Value (EV) and whether it justifies the risk.
+4. Keep it under 200 words. Use Markdown formatting (bolding key terms)."""
+
 class GeminiAdvisor:
     """Hybrid advisor that uses HeuristicAIAdvisor for math and Gemini for reasoning."""
 
     def __init__(self, model_name: str = "gemini-1.5-flash"):
-        load_dotenv()
+        global _ENV_LOADED
+        # Imports dotenv and google.generativeai lazily: the gRPC/protobuf
+        # stack is heavyweight, and heuristic-mode runs should not pay for it.
+        # .env is only read once per process
+        if not _ENV_LOADED:
+            from dotenv import load_dotenv
+
+            load_dotenv()
+            _ENV_LOADED = True
         api_key = os.getenv("GEMINI_API_KEY")
         if not api_key:
             LOGGER.warning("GEMINI_API_KEY not found. Falling back to heuristic-only mode.")
             self.client = None
         else:
-            genai.configure(api_key=api_key)
-            self.model = genai.GenerativeModel(model_name)
+            # Reuses a configured model across advisor instances
+            cache_key = (
+                model_name,
+                hashlib.blake2b(api_key.encode(), digest_size=8).hexdigest(),
+            )
+            model = _MODEL_CACHE.get(cache_key)
+            if model is None:
+                import google.generativeai as genai
+
+                genai.configure(api_key=api_key)
+                model = genai.GenerativeModel(model_name)
+                _MODEL_CACHE[cache_key] = model
+            self.model = model
             self.client = True
         
         self.heuristic_advisor = HeuristicAIAdvisor()
+        # LRU cache of Gemini responses keyed by prompt hash; identical
+        # parlays re-run in a session skip the network round trip entirely
+        self._response_cache: OrderedDict[str, str] = OrderedDict()
+        self._response_cache_size = 256
 
     def _construct_prompt(self, context: AnalysisContext) -> str:
         """Builds the prompt for Gemini using the deterministic analysis context."""
-        
-        prompt = f"""
-You are an expert NFL betting advisor. Your goal is to explain the value of a parlay bet based on PRE-CALCULATED mathematical data.
-DO NOT recalculate probabilities. Trust the provided numbers.
-
-PARLAY SUMMARY:
-- Verdict: {context.verdict}
-- Value Score: {context.overall_score:.2f} (Scale: -1.0 to 1.0)
-- Expected Value: ${context.expected_value:.2f}
-- Combined Hit Probability: {context.combined_probability:.2%}
-
-LEGS DETAIL:
-"""
+        # Accumulates lines in a list and joins once instead of repeated
+        # string concatenation, which is quadratic on note-heavy parlays
+        parts = [
+            _PROMPT_HEADER,
+            "",
+            "PARLAY SUMMARY:",
+            f"- Verdict: {context.verdict}",
+            f"- Value Score: {context.overall_score:.2f} (Scale: -1.0 to 1.0)",
+            f"- Expected Value: ${context.expected_value:.2f}",
+            f"- Combined Hit Probability: {context.combined_probability:.2%}",
+            "",
+            "LEGS DETAIL:",
+        ]
         for leg in context.parlay.legs:
-            scores = context.leg_scores.get(leg.leg_id, {})
-            implied = scores.get("implied_prob", 0)
-            adjusted = scores.get("adjusted_prob", 0)
+            scores = context.leg_scores.get(leg.leg_id)
+            implied = scores.implied_prob if scores else 0
+            adjusted = scores.adjusted_prob if scores else 0
             diff = adjusted - implied
-            
-            prompt += f"\nLeg {leg.leg_id}: {leg.description}\n"
-            prompt += f"  - Implied Probability (Odds): {implied:.1%}\n"
-            prompt += f"  - Adjusted Probability (Model): {adjusted:.1%}\n"
-            prompt += f"  - Difference: {diff:+.1%}\n"
+
+            parts.append(f"\nLeg {leg.leg_id}: {leg.description}")
+            parts.append(f"  - Implied Probability (Odds): {implied:.1%}")
+            parts.append(f"  - Adjusted Probability (Model): {adjusted:.1%}")
+            parts.append(f"  - Difference: {diff:+.1%}")
             if leg.notes:
-                prompt += "  - Signals:\n"
-                for note in leg.notes:
-                    prompt += f"    * {note}\n"
+                parts.append("  - Signals:")
+                parts.extend(f"    * {note}" for note in leg.notes)
 
-        prompt += """
-TASK:
-Write a concise, professional analysis of this parlay.
-1. Start with a clear "Recommendation" (e.g., "This is a strong play because...", "Proceed with caution due to...").
-2. Analyze the key legs. Explain WHY the model adjusted the probability (refer to the signals like injuries or history).
-3. Mention the Expected Value (EV) and whether it justifies the risk.
-4. Keep it under 200 words. Use Markdown formatting (bolding key terms).
-"""
-        return prompt
+        parts.append(_PROMPT_TASK)
+        return "\n".join(parts)
+
+    def _generate_rationale(self, prompt: str) -> str:
+        # Memoizes Gemini responses on the prompt digest with LRU eviction
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._response_cache.move_to_end(key)
+            return cached
+        text = self.model.generate_content(prompt).text
+        self._response_cache[key] = text
+        if len(self._response_cache) > self._response_cache_size:
+            self._response_cache.popitem(last=False)
+        return text
 
     def evaluate(self, parlay) -> EvaluationResult:
         # 1. Run the deterministic math
         context = self.heuristic_advisor.get_analysis_context(parlay)
         
-        # 2. If no API key, return the heuristic result directly
+        # 2. If no API key, reuse the already-computed context instead of re-evaluating
         if not self.client:
-            return self.heuristic_advisor.evaluate(parlay)
+            return self.heuristic_advisor.result_from_context(context)
 
-        # 3. Call Gemini
+        # 3. Call Gemini (through the response cache)
         try:
             prompt = self._construct_prompt(context)
-            response = self.model.generate_content(prompt)
-            ai_rationale = response.text
+            ai_rationale = self._generate_rationale(prompt)
         except Exception as exc:
             LOGGER.error("Gemini API failed: %s", exc)
             ai_rationale = "AI Analysis unavailable. Falling back to standard rationale.\n" + "\n".join(context.rationale)
@@ -10,9 +10,15 @@ from typing import Any, Dict
 from .config import APISettings
 from .models import Parlay
 from .parlay_evaluator import ParlayEvaluator, build_parlay_from_dict
-from .analysis.llm_advisor import GeminiAdvisor
 from .ui import RichPresenter
 
+try:  # pragma: no cover - optional dependency handling
+    import orjson  # type: ignore
+
+    _json_loads = orjson.loads
+except Exception:  # pragma: no cover
+    _json_loads = json.loads
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -56,8 +62,10 @@ def parse_args() -> argparse.Namespace:
 
 
 def load_parlay(path: Path, stake_override: float | None = None) -> Parlay:
-    # Loads the parlay JSON and optionally overrides the stake value
-    data: Dict[str, Any] = json.loads(path.read_text())
+    # Loads the parlay JSON and optionally overrides the stake value;
+    # reading bytes skips the intermediate str decode and lets orjson
+    # parse directly when it is installed
+    data: Dict[str, Any] = _json_loads(path.read_bytes())
     parlay = build_parlay_from_dict(data)
     if stake_override is not None:
         parlay.stake = stake_override
@@ -74,9 +82,12 @@ def main() -> None:
     # Initialize Evaluator
     evaluator = ParlayEvaluator(settings=settings, use_live_data=not args.disable_live_data)
     
-    # Swap out the advisor if Hybrid mode is selected
+    # Swap out the advisor if Hybrid mode is selected; the import stays
+    # inside the branch so heuristic runs skip the Gemini stack entirely
     if args.ai_model == "hybrid":
         LOGGER.info("Initializing Hybrid AI (Gemini)...")
+        from .analysis.llm_advisor import GeminiAdvisor
+
         evaluator.advisor = GeminiAdvisor()
     
     parlay = load_parlay(args.parlay, args.stake)
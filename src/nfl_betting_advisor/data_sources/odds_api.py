@@ -2,13 +2,18 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..config import APISettings
 from ..http_client import http_get
 
 LOGGER = logging.getLogger(__name__)
 
+# How long fetched prop markets stay fresh; one parlay evaluation resolving
+# several players should reuse a single fetch
+_PROPS_CACHE_TTL = 30.0
+
 
 class OddsAPIClient:
     BASE_URL = "https://api.the-odds-api.com/v4"
@@ -16,6 +21,8 @@ class OddsAPIClient:
     def __init__(self, settings: APISettings):
         # Stores configuration and API credentials for outbound calls
         self.settings = settings
+        # Request-scoped cache of prop markets keyed by (event, market)
+        self._props_cache: Dict[Tuple[Optional[str], str], Tuple[float, List[Dict]]] = {}
 
     def _request(self, endpoint: str, params: Optional[Dict[str, str]] = None) -> Any:
         # Builds the request payload and delegates to the shared HTTP helper
@@ -38,29 +45,50 @@ class OddsAPIClient:
         return self._request("sports/{sport}/events".format(sport=self.settings.odds_sport_key))
 
     def get_player_props(self, event_id: Optional[str] = None) -> List[Dict]:
-        # Retrieves player prop markets, optionally filtered by event
+        # Retrieves player prop markets, optionally filtered by event; recent
+        # responses are served from the TTL cache so a multi-player parlay
+        # evaluation costs one HTTP round trip instead of one per player
+        key = (event_id, self.settings.odds_market)
+        cached = self._props_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _PROPS_CACHE_TTL:
+            return cached[1]
         endpoint = "odds"
         params: Dict[str, str] = {}
         if event_id:
             params["event"] = event_id
-        return self._request(endpoint, params=params)
+        data = self._request(endpoint, params=params)
+        self._props_cache[key] = (time.monotonic(), data)
+        return data
 
     def get_best_player_prop_odds(self, player_name: str, market: Optional[str] = None) -> Optional[Dict]:
         # Iterates through outcomes to find the best available price for a player prop
         markets_data = self.get_player_props()
         best_offer: Optional[Dict] = None
+        # Hoists the loop-invariant name key and running best price so the
+        # inner loop compares locals instead of re-lowering and dict-probing
+        player_key = player_name.lower()
+        best_price = float("-inf")
         for event in markets_data:
             for bookmaker in event.get("bookmakers", []):
-                for market_data in bookmaker.get("markets", []):
-                    if market and market_data.get("key") != market:
-                        continue
+                markets = bookmaker.get("markets", [])
+                if market:
+                    # Pre-skips markets that don't match the requested key
+                    markets = (m for m in markets if m.get("key") == market)
+                for market_data in markets:
                     for outcome in market_data.get("outcomes", []):
+                        odds = outcome.get("price")
+                        if odds is None:
+                            continue
                         outcome_name = outcome.get("description") or outcome.get("name")
                         if not outcome_name:
                             continue
-                        if player_name.lower() in outcome_name.lower():
-                            odds = int(outcome.get("price", 0))
-                            if not best_offer or odds > best_offer["price"]:
+                        if player_key in outcome_name.lower():
+                            # Feeds are int-typed in the common case; only
+                            # coerce when a bookmaker sends something else
+                            if not isinstance(odds, int):
+                                odds = int(odds)
+                            if odds > best_price:
+                                best_price = odds
                                 best_offer = {
                                     "event": event.get("id"),
                                     "bookmaker": bookmaker.get("title"),
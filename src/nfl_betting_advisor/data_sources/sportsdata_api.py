@@ -2,7 +2,12 @@
 from __future__ import annotations
 
 import datetime as dt
+import hashlib
+import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ..config import APISettings
@@ -10,6 +15,13 @@ from ..http_client import http_get
 
 LOGGER = logging.getLogger(__name__)
 
+# Season-scoped SportsDataIO payloads change at most daily (historical
+# seasons never), so responses are cached on disk and re-served until the
+# TTL lapses; injuries refresh far more often and get a shorter window
+_CACHE_DIR = Path.home() / ".cache" / "nfl-betting-advisor"
+_DEFAULT_CACHE_TTL = 6 * 60 * 60
+_INJURY_CACHE_TTL = 15 * 60
+
 
 class SportsDataClient:
     BASE_URL = "https://api.sportsdata.io/v3/nfl"
@@ -17,18 +29,60 @@ class SportsDataClient:
     def __init__(self, settings: APISettings):
         # Stores API credentials and configuration for SportsDataIO requests
         self.settings = settings
+        # The default season is invariant for the client's lifetime, so the
+        # OS time lookup happens once instead of per call
+        self._default_season = settings.sportsdata_season or dt.date.today().year
 
-    def _request(self, endpoint: str, params: Optional[Dict[str, str]] = None) -> Any:
-        # Issues an authenticated GET request to the SportsDataIO endpoint
+    def _request(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, str]] = None,
+        cache_ttl: int = _DEFAULT_CACHE_TTL,
+    ) -> Any:
+        # Issues an authenticated GET request to the SportsDataIO endpoint,
+        # serving from the on-disk cache while the entry is still fresh
         url = f"{self.BASE_URL}/{endpoint}"
+        cache_path = self._cache_path(endpoint, params) if cache_ttl else None
+        if cache_path:
+            cached = self._read_cache(cache_path, cache_ttl)
+            if cached is not None:
+                return cached
         headers = {"Ocp-Apim-Subscription-Key": self.settings.sportsdata_api_key}
         LOGGER.debug("Requesting %s with %s", url, params)
-        return http_get(url, params=params, headers=headers)
+        data = http_get(url, params=params, headers=headers)
+        if cache_path:
+            self._write_cache(cache_path, data)
+        return data
+
+    @staticmethod
+    def _cache_path(endpoint: str, params: Optional[Dict[str, str]]) -> Path:
+        # Derives a stable cache filename from the endpoint and params
+        key = hashlib.sha1(f"{endpoint}?{sorted((params or {}).items())}".encode()).hexdigest()
+        return _CACHE_DIR / f"{key}.json"
+
+    @staticmethod
+    def _read_cache(path: Path, cache_ttl: int) -> Any:
+        # Returns the cached payload when present and within its TTL
+        try:
+            if time.time() - path.stat().st_mtime < cache_ttl:
+                return json.loads(path.read_text())
+        except (OSError, ValueError):  # pragma: no cover - missing or corrupt entry
+            pass
+        return None
+
+    @staticmethod
+    def _write_cache(path: Path, data: Any) -> None:
+        # Best-effort persistence; cache failures never break the request
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(data))
+        except (OSError, TypeError):  # pragma: no cover - unwritable cache dir
+            LOGGER.debug("Could not write response cache at %s", path)
 
     def get_injuries(self, season: Optional[int] = None) -> List[Dict]:
         # Pulls injury data for the specified season or current year
-        season = season or self.settings.sportsdata_season or dt.datetime.now().year
-        return self._request(f"scores/json/Injuries/{season}")
+        season = season or self._default_season
+        return self._request(f"scores/json/Injuries/{season}", cache_ttl=_INJURY_CACHE_TTL)
 
     def get_players(self) -> List[Dict]:
         # Retrieves the full player directory from SportsDataIO
@@ -36,35 +90,47 @@ class SportsDataClient:
 
     def get_team_game_stats(self, season: Optional[int] = None) -> List[Dict]:
         # Fetches per-game team statistics for a season
-        season = season or self.settings.sportsdata_season or dt.datetime.now().year
+        season = season or self._default_season
         return self._request(f"stats/json/TeamGameStats/{season}")
 
     def get_team_season_stats(self, season: Optional[int] = None) -> List[Dict]:
         # Fetches season-level team statistics aggregates
-        season = season or self.settings.sportsdata_season or dt.datetime.now().year
+        season = season or self._default_season
         return self._request(f"stats/json/TeamSeasonStats/{season}")
 
     def get_team_records(self, season: Optional[int] = None) -> List[Dict]:
         # Retrieves team standings for a given season
-        season = season or self.settings.sportsdata_season or dt.datetime.now().year
+        season = season or self._default_season
         return self._request(f"scores/json/Standings/{season}")
 
     def get_head_to_head_record(self, team_a: str, team_b: str, lookback_years: int = 5) -> Dict[str, int]:
         # Aggregates head-to-head wins between two teams over a rolling window
-        current_year = self.settings.sportsdata_season or dt.datetime.now().year
+        current_year = self._default_season
         wins_a = wins_b = 0
-        for season in range(current_year - lookback_years, current_year + 1):
-            games = self._request(f"scores/json/Scores/{season}")
+        # Fetches the per-season schedules concurrently: each request is an
+        # independent network round trip, so wall time drops from the sum of
+        # the season fetches to roughly the slowest one
+        seasons = range(current_year - lookback_years, current_year + 1)
+        with ThreadPoolExecutor(max_workers=len(seasons)) as executor:
+            season_games = list(
+                executor.map(lambda season: self._request(f"scores/json/Scores/{season}"), seasons)
+            )
+        # Tallies wins in a single branch-light pass: each game is read once
+        # into locals, the matchup test is plain string equality (no per-game
+        # set allocations), and the winner resolves to one boolean
+        for games in season_games:
             for game in games:
-                if {game.get("HomeTeam"), game.get("AwayTeam")} == {team_a, team_b}:
-                    if game.get("HomeTeam") == team_a:
-                        if game.get("HomeScore", 0) > game.get("AwayScore", 0):
-                            wins_a += 1
-                        else:
-                            wins_b += 1
-                    else:
-                        if game.get("AwayScore", 0) > game.get("HomeScore", 0):
-                            wins_a += 1
-                        else:
-                            wins_b += 1
+                home_team = game.get("HomeTeam")
+                away_team = game.get("AwayTeam")
+                if not (
+                    (home_team == team_a and away_team == team_b)
+                    or (home_team == team_b and away_team == team_a)
+                ):
+                    continue
+                home_score = game.get("HomeScore", 0)
+                away_score = game.get("AwayScore", 0)
+                a_home = home_team == team_a
+                a_won = (home_score > away_score) if a_home else (away_score > home_score)
+                wins_a += a_won
+                wins_b += not a_won
         return {team_a: wins_a, team_b: wins_b}
@@ -9,9 +9,31 @@ from urllib.request import Request, urlopen
 
 try:  # pragma: no cover - optional dependency handling
     import requests  # type: ignore
+    from requests.adapters import HTTPAdapter, Retry  # type: ignore
 except Exception:  # pragma: no cover
     requests = None  # type: ignore
 
+try:  # pragma: no cover - optional dependency handling
+    import orjson  # type: ignore
+
+    _json_loads = orjson.loads
+except Exception:  # pragma: no cover
+    _json_loads = json.loads
+
+if requests:  # pragma: no cover - exercised only when requests is installed
+    # One shared session keeps TCP+TLS connections alive across calls, so
+    # repeated requests to the same API host skip the handshake entirely
+    _SESSION = requests.Session()
+    _ADAPTER = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    _SESSION.mount("https://", _ADAPTER)
+    _SESSION.mount("http://", _ADAPTER)
+else:  # pragma: no cover
+    _SESSION = None
+
 
 class HTTPErrorResponse(RuntimeError):
     """Raised when an HTTP request fails."""
@@ -24,12 +46,14 @@ class HTTPErrorResponse(RuntimeError):
 
 
 def http_get(url: str, params: Optional[Dict[str, str]] = None, headers: Optional[Dict[str, str]] = None) -> Dict:
-    # Prefers the requests library when it is available
-    if requests:  # pragma: no cover - prefer requests when available
-        response = requests.get(url, params=params, headers=headers, timeout=30)
+    # Prefers the pooled requests session when it is available
+    if _SESSION:  # pragma: no cover - prefer requests when available
+        response = _SESSION.get(url, params=params, headers=headers, timeout=30)
         if not response.ok:
             raise HTTPErrorResponse(response.status_code, response.text)
-        return response.json()
+        # Parses the raw bytes directly, skipping the intermediate str
+        # decode that response.json() would perform
+        return _json_loads(response.content)
 
     # Falls back to urllib with manual query string handling
     query_string = urlencode(params or {})
@@ -37,9 +61,9 @@ def http_get(url: str, params: Optional[Dict[str, str]] = None, headers: Optiona
     request = Request(full_url, headers=headers or {})
     try:
         with urlopen(request, timeout=30) as response:  # nosec B310
-            charset = response.headers.get_content_charset("utf-8")
-            payload = response.read().decode(charset)
-            return json.loads(payload)
+            # Both json.loads and orjson.loads accept bytes, so the payload
+            # never needs an explicit decode pass
+            return _json_loads(response.read())
     except HTTPError as exc:  # pragma: no cover - network failure path
         raise HTTPErrorResponse(exc.code, exc.reason) from exc
     except URLError as exc:  # pragma: no cover
@@ -2,10 +2,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from math import prod
 from typing import List, Optional, Dict
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Player:
     """Represents an NFL player relevant to a bet."""
 
@@ -18,7 +19,7 @@ class Player:
     injury_status: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BetLeg:
     """A single bet leg within a parlay."""
 
@@ -33,19 +34,29 @@ class BetLeg:
     adjusted_probability: Optional[float] = None
     notes: List[str] = field(default_factory=list)
     metadata: Dict[str, str] = field(default_factory=dict)
+    # Derived in __post_init__; declared so they get slots
+    _implied: float = field(init=False, repr=False)
+    _decimal: float = field(init=False, repr=False)
 
-    def implied_probability(self) -> float:
-        """Return the implied probability from the American odds."""
-        # Converts American odds into a probability representation
+    def __post_init__(self) -> None:
+        # Converts the American odds once; both probabilities are pure
+        # functions of odds_american and get re-read on every evaluation
         odds = self.odds_american
         if odds == 0:
             raise ValueError("American odds cannot be 0")
-        if odds > 0:
-            return 100 / (odds + 100)
-        return -odds / (-odds + 100)
+        # Branchless form of the American-odds conversion: the numerator is
+        # abs(odds) for negative odds and 100 for positive, selected with a
+        # bool multiply instead of a sign branch
+        magnitude = abs(odds)
+        self._implied = (100 + (odds < 0) * (magnitude - 100)) / (magnitude + 100)
+        self._decimal = 1.0 / self._implied
+
+    def implied_probability(self) -> float:
+        """Return the implied probability from the American odds."""
+        return self._implied
 
 
-@dataclass
+@dataclass(slots=True)
 class Parlay:
     """A parlay consisting of multiple bet legs."""
 
@@ -54,29 +65,37 @@ class Parlay:
 
     def combined_probability(self) -> Optional[float]:
         """Return the combined probability if all legs have adjusted probabilities."""
-        # Multiplies adjusted probabilities, aborting if any leg lacks an adjustment
-        probability = 1.0
+        # Multiplies adjusted probabilities, returning as soon as a leg
+        # lacks an adjustment; each attribute is fetched exactly once
+        probabilities = []
         for leg in self.legs:
-            if leg.adjusted_probability is None:
+            probability = leg.adjusted_probability
+            if probability is None:
                 return None
-            probability *= leg.adjusted_probability
-        return probability
+            probabilities.append(probability)
+        return prod(probabilities)
 
     def combined_decimal_odds(self) -> float:
-        # Converts each leg to decimal odds and multiplies them into a parlay price
-        decimal_odds = 1.0
-        for leg in self.legs:
-            implied = leg.implied_probability()
-            if implied == 0:
-                raise ValueError("Leg implied probability cannot be 0")
-            decimal_odds *= 1 / implied
-        return decimal_odds
+        # Multiplies the precomputed per-leg decimal odds into a parlay price
+        return prod(leg._decimal for leg in self.legs)
 
     def potential_payout(self) -> float:
         # Calculates the total return excluding the original stake
         return self.stake * (self.combined_decimal_odds() - 1)
 
 
+@dataclass(slots=True)
+class LegBreakdown:
+    """Per-leg scoring signals in a flat, fixed-field record."""
+
+    ev: float
+    injury: float
+    history: float
+    market: float
+    implied_prob: float
+    adjusted_prob: float
+
+
 @dataclass
 class EvaluationResult:
     overall_value_score: float
@@ -84,4 +103,4 @@ class EvaluationResult:
     expected_value: Optional[float]
     combined_probability: Optional[float]
     rationale: List[str]
-    leg_breakdown: Dict[str, Dict[str, float]]
+    leg_breakdown: Dict[str, LegBreakdown]
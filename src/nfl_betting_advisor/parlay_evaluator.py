@@ -1,9 +1,12 @@
 """Parlay evaluation orchestration."""
 from __future__ import annotations
 
+import datetime as dt
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from typing import Dict, Iterable, Optional
+from typing import Dict, Iterable, Optional, Tuple
 
 from .analysis.ai_advisor import HeuristicAIAdvisor
 from .analysis.historical_analyzer import HistoricalAnalyzer
@@ -15,6 +18,17 @@ from .models import BetLeg, EvaluationResult, Parlay, Player
 
 LOGGER = logging.getLogger(__name__)
 
+# Injury index shared across evaluator instances; web-style callers that
+# build a fresh ParlayEvaluator per request reuse the same adjuster until
+# the report window lapses
+_INJURY_ADJUSTER_TTL = 15 * 60
+_INJURY_ADJUSTERS: Dict[int, Tuple[float, InjuryAdjuster]] = {}
+
+
+def _normalize_name(name: str) -> str:
+    # Canonical form for player-name lookups shared by load and attach
+    return name.casefold().strip()
+
 
 class ParlayEvaluator:
     """Coordinates data fetching, adjustments, and AI scoring."""
@@ -26,7 +40,7 @@ class ParlayEvaluator:
         self.odds_client = OddsAPIClient(self.settings)
         self.sportsdata_client = SportsDataClient(self.settings)
         self.advisor = HeuristicAIAdvisor()
-        self._player_directory: Dict[str, Player] = {}
+        self._player_directory: Dict[str, Dict] = {}
         self._injury_adjuster: Optional[InjuryAdjuster] = None
 
     def _load_players(self) -> None:
@@ -38,61 +52,135 @@ class ParlayEvaluator:
         except Exception as exc:  # pylint: disable=broad-except
             LOGGER.warning("Failed to load players from SportsDataIO: %s", exc)
             return
-        for player in players:
-            player_id = str(player.get("PlayerID"))
-            name = player.get("Name")
-            team = player.get("Team")
-            position = player.get("Position", "")
-            if not name or not team:
-                continue
-            self._player_directory[name.lower()] = Player(
-                player_id=player_id,
-                name=name,
-                team=team,
-                position=position,
-            )
+        # Stores the raw feed entries in one comprehension pass; only the
+        # handful of players actually referenced by a parlay are
+        # materialized into Player objects
+        self._player_directory = {
+            _normalize_name(player["Name"]): player
+            for player in players
+            if player.get("Name") and player.get("Team")
+        }
 
     def _load_injuries(self) -> None:
-        # Pulls the current injury report and prepares the adjuster
+        # Pulls the current injury report and prepares the adjuster,
+        # sharing the built index across evaluator instances via a
+        # process-level TTL cache
         if self._injury_adjuster or not self.use_live_data:
             return
+        season = self.settings.sportsdata_season or dt.datetime.now().year
+        cached = _INJURY_ADJUSTERS.get(season)
+        if cached and time.monotonic() - cached[0] < _INJURY_ADJUSTER_TTL:
+            self._injury_adjuster = cached[1]
+            return
         try:
-            injuries = self.sportsdata_client.get_injuries()
+            injuries = self.sportsdata_client.get_injuries(season)
         except Exception as exc:  # pylint: disable=broad-except
             LOGGER.warning("Failed to load injuries from SportsDataIO: %s", exc)
-            injuries = []
+            self._injury_adjuster = InjuryAdjuster([])
+            return
         self._injury_adjuster = InjuryAdjuster(injuries)
+        _INJURY_ADJUSTERS[season] = (time.monotonic(), self._injury_adjuster)
 
     def _attach_players(self, legs: Iterable[BetLeg]) -> None:
         # Maps metadata player names onto BetLeg objects
         self._load_players()
         for leg in legs:
-            player_name = leg.metadata.get("player_name") if leg.metadata else None
-            if player_name and leg.player is None:
-                player = self._player_directory.get(player_name.lower())
-                if player:
-                    leg.player = player
-                else:
-                    LOGGER.debug("Player %s not found in directory", player_name)
-
-    @lru_cache(maxsize=16)
+            if leg.player is not None or not leg.metadata:
+                continue
+            # Caches the normalized key on the leg so repeat evaluations
+            # skip the normalization entirely
+            player_key = leg.metadata.get("player_key")
+            if player_key is None:
+                player_name = leg.metadata.get("player_name")
+                if not player_name:
+                    continue
+                player_key = _normalize_name(player_name)
+                leg.metadata["player_key"] = player_key
+            raw = self._player_directory.get(player_key)
+            if raw:
+                # Builds the dataclass lazily, only for players a leg uses
+                leg.player = Player(
+                    player_id=str(raw.get("PlayerID")),
+                    name=raw["Name"],
+                    team=raw["Team"],
+                    position=raw.get("Position", ""),
+                )
+            else:
+                LOGGER.debug("Player %s not found in directory", player_key)
+
     def _get_head_to_head(self, team_a: str, team_b: str) -> Dict[str, int]:
+        # Sorts the pair so both orientations of a matchup share one cache
+        # entry, halving remote fetches when legs reference each side
+        first, second = sorted((team_a, team_b))
+        record = self._get_head_to_head_sorted(first, second)
+        return {team_a: record[team_a], team_b: record[team_b]}
+
+    @lru_cache(maxsize=64)
+    def _get_head_to_head_sorted(self, team_a: str, team_b: str) -> Dict[str, int]:
         try:
             return self.sportsdata_client.get_head_to_head_record(team_a, team_b)
         except Exception as exc:  # pylint: disable=broad-except
             LOGGER.warning("Failed to fetch head-to-head record for %s vs %s: %s", team_a, team_b, exc)
             return {team_a: 0, team_b: 0}
 
+    def _prefetch_market_data(self, parlay: Parlay) -> Dict[str, Optional[Dict]]:
+        # Resolves all network-bound lookups for the parlay concurrently so
+        # the adjustment loop below only does local math; N serial round
+        # trips collapse into one parallel batch
+        price_legs = []
+        matchups = set()
+        for leg in parlay.legs:
+            metadata = leg.metadata or {}
+            opponent_team = metadata.get("opponent_team")
+            target_team = leg.team or (leg.player.team if leg.player else None)
+            if target_team and opponent_team:
+                # Sorted pair so legs on both sides of one game collapse to a
+                # single warm-up fetch (the lru_cache below does not dedupe
+                # calls that are in flight at the same time)
+                matchups.add(tuple(sorted((target_team, opponent_team))))
+            if metadata.get("player_name"):
+                price_legs.append(leg)
+        if not price_legs and not matchups:
+            return {}
+        if price_legs:
+            # Warms the props TTL cache with one fetch before fanning out;
+            # otherwise every worker would miss the cold cache at once and
+            # issue its own identical quota-billed request
+            try:
+                self.odds_client.get_player_props()
+            except Exception as exc:  # pylint: disable=broad-except
+                LOGGER.debug("Failed to warm player props cache: %s", exc)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # Warms the head-to-head cache; results are read from it later
+            for team_a, team_b in matchups:
+                executor.submit(self._get_head_to_head, team_a, team_b)
+            prices = list(executor.map(self._fetch_market_price, price_legs))
+        return {leg.leg_id: price for leg, price in zip(price_legs, prices)}
+
+    def _fetch_market_price(self, leg: BetLeg) -> Optional[Dict]:
+        try:
+            market = leg.metadata.get("market_key") if leg.metadata else None
+            return self.odds_client.get_best_player_prop_odds(
+                leg.metadata.get("player_name", ""), market=market
+            )
+        except Exception as exc:  # pylint: disable=broad-except
+            LOGGER.debug("Failed to fetch market price for %s: %s", leg.leg_id, exc)
+            return None
+
     def _apply_adjustments(self, parlay: Parlay) -> None:
         # Runs all enrichment steps on the incoming parlay legs
         self._attach_players(parlay.legs)
         self._load_injuries()
+        market_prices = self._prefetch_market_data(parlay) if self.use_live_data else {}
         for leg in parlay.legs:
+            # Hoists the repeated metadata and attribute reads into locals
+            metadata = leg.metadata or {}
+            opponent_team = metadata.get("opponent_team")
+            player_name = metadata.get("player_name")
+            target_team = leg.team or (leg.player.team if leg.player else None)
             # Establishes baseline probabilities using implied odds if absent
             if leg.baseline_probability is None:
                 leg.baseline_probability = leg.implied_probability()
-            opponent_team = leg.metadata.get("opponent_team") if leg.metadata else None
-            target_team = leg.team or (leg.player.team if leg.player else None)
             if self._injury_adjuster and opponent_team:
                 # Applies injury adjustments when relevant data is available
                 adjusted = self._injury_adjuster.adjust_leg(leg, opponent_team=opponent_team)
@@ -109,31 +197,20 @@ class ParlayEvaluator:
                 if adjusted is not None:
                     leg.adjusted_probability = adjusted
                     leg.baseline_probability = leg.adjusted_probability
-            if self.use_live_data and leg.metadata.get("player_name"):
+            if self.use_live_data and player_name:
                 # Annotates the leg with current market pricing information
-                self._annotate_market_price(leg)
+                self._annotate_market_price(leg, market_prices.get(leg.leg_id))
 
-    def _annotate_market_price(self, leg: BetLeg) -> None:
-        try:
-            market = leg.metadata.get("market_key") if leg.metadata else None
-            best_price = self.odds_client.get_best_player_prop_odds(
-                leg.metadata.get("player_name", ""), market=market
-            )
-        except Exception as exc:  # pylint: disable=broad-except
-            LOGGER.debug("Failed to fetch market price for %s: %s", leg.leg_id, exc)
-            return
+    def _annotate_market_price(self, leg: BetLeg, best_price: Optional[Dict]) -> None:
         if not best_price:
             return
         market_odds = best_price.get("price")
         if market_odds is None:
             return
-        leg.notes.append(
-            "Best price available: {bookmaker} {market} at {price:+d}".format(
-                bookmaker=best_price.get("bookmaker", "unknown"),
-                market=best_price.get("market", "market"),
-                price=int(market_odds),
-            )
-        )
+        bookmaker = best_price.get("bookmaker", "unknown")
+        market_name = best_price.get("market", "market")
+        price = int(market_odds)
+        leg.notes.append(f"Best price available: {bookmaker} {market_name} at {price:+d}")
 
     def evaluate(self, parlay: Parlay) -> EvaluationResult:
         # Applies all adjustments and runs the heuristic advisor
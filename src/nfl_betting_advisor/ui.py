@@ -1,5 +1,8 @@
 """Rich terminal UI for NFL Betting Advisor."""
-from rich.console import Console
+from functools import lru_cache
+
+from rich.console import Console, Group
+from rich.rule import Rule
 from rich.table import Table
 from rich.panel import Panel
 from rich.markdown import Markdown
@@ -7,14 +10,23 @@ from rich import box
 
 from .models import Parlay, EvaluationResult
 
+
+@lru_cache(maxsize=64)
+def _render_markdown(content: str) -> Markdown:
+    # Re-displaying the same rationale (watch/refresh loops) skips Rich's
+    # markdown tokenizer on cache hits
+    return Markdown(content)
+
+
 class RichPresenter:
     def __init__(self):
         self.console = Console()
 
     def display_parlay_evaluation(self, parlay: Parlay, result: EvaluationResult):
-        self.console.print()
-        self.console.rule("[bold green]NFL Parlay Advisor[/bold green]")
-        self.console.print()
+        # Collects every renderable and emits them in one console.print at
+        # the end, so the terminal gets a single buffered write instead of
+        # one flush per section
+        renderables = ["", Rule("[bold green]NFL Parlay Advisor[/bold green]"), ""]
 
         # 1. Legs Table
         table = Table(box=box.ROUNDED, title="Leg Analysis")
@@ -25,9 +37,10 @@ class RichPresenter:
         table.add_column("Delta", justify="right")
 
         for leg in parlay.legs:
-            breakdown = result.leg_breakdown.get(leg.leg_id, {})
-            implied = breakdown.get("implied_prob", 0)
-            adjusted = breakdown.get("adjusted_prob", leg.adjusted_probability or 0)
+            breakdown = result.leg_breakdown.get(leg.leg_id)
+            # Direct attribute reads on the slotted LegBreakdown record
+            implied = breakdown.implied_prob if breakdown else 0
+            adjusted = breakdown.adjusted_prob if breakdown else (leg.adjusted_probability or 0)
             delta = adjusted - implied
             
             delta_str = f"{delta:+.1%}"
@@ -41,8 +54,7 @@ class RichPresenter:
                 f"[{delta_style}]{delta_str}[/{delta_style}]"
             )
 
-        self.console.print(table)
-        self.console.print()
+        renderables.extend([table, ""])
 
         # 2. Summary Panel
         summary_text = f"""
@@ -55,20 +67,21 @@ class RichPresenter:
         if result.overall_value_score < -0.1:
             color = "red"
             
-        self.console.print(Panel(summary_text.strip(), title="Summary", border_style=color, expand=False))
-        self.console.print()
+        renderables.extend(
+            [Panel(summary_text.strip(), title="Summary", border_style=color, expand=False), ""]
+        )
 
         # 3. AI Rationale
         # Check if rationale is a single markdown string (LLM) or list of bullets (Heuristic)
         if result.rationale:
-            self.console.rule("[bold blue]AI Analysis[/bold blue]")
-            self.console.print()
-            
+            renderables.extend([Rule("[bold blue]AI Analysis[/bold blue]"), ""])
+
             content = result.rationale[0]
             if len(result.rationale) > 1:
                 # Fallback for heuristic list
                 content = "\n".join(f"- {r}" for r in result.rationale)
-            
-            md = Markdown(content)
-            self.console.print(Panel(md, border_style="blue"))
-            self.console.print()
+
+            md = _render_markdown(content)
+            renderables.extend([Panel(md, border_style="blue"), ""])
+
+        self.console.print(Group(*renderables))
@@ -4,6 +4,11 @@ from __future__ import annotations
 import math
 from typing import Iterable, List
 
+try:  # pragma: no cover - optional dependency handling
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
 
 def american_to_decimal(odds: int) -> float:
     # Converts American odds into decimal odds for computation
@@ -25,10 +30,7 @@ def decimal_to_american(decimal: float) -> int:
 
 def combine_probabilities(probabilities: Iterable[float]) -> float:
     # Multiplies independent probabilities to create a parlay probability
-    total = 1.0
-    for prob in probabilities:
-        total *= prob
-    return total
+    return math.prod(probabilities)
 
 
 def expected_value(probability: float, decimal_odds: float, stake: float) -> float:
@@ -40,6 +42,10 @@ def z_score(values: List[float]) -> List[float]:
     # Normalizes a sequence of values into z-scores
     if not values:
         return []
+    if np is not None:
+        # Single C-level pass instead of three Python-level sweeps
+        arr = np.asarray(values, dtype=np.float64)
+        return ((arr - arr.mean()) / (arr.std() or 1.0)).tolist()
     mean = sum(values) / len(values)
     variance = sum((value - mean) ** 2 for value in values) / len(values)
     std_dev = math.sqrt(variance) if variance > 0 else 1